@@ -1,28 +1,130 @@
 import serial
 import serial.tools.list_ports
+import argparse
+import contextlib
 import json
-import pyautogui
+import re
 import time
 import os
+import socket
+import sys
+import threading
+from collections import deque
 from rich.console import Console
 from rich.table import Table
 from rich.prompt import Prompt, Confirm, IntPrompt
-from rich.live import Live
-from rich.panel import Panel
-from rich.text import Text
+
+try:
+    # orjson is optional: a faster C parser that reads bytes directly.
+    # Its JSONDecodeError subclasses json.JSONDecodeError.
+    from orjson import loads as json_loads
+except ImportError:
+    def json_loads(data):
+        # The stdlib decoder does not accept memoryview frames
+        return json.loads(bytes(data))
 
 # --- Configuration File ---
-CONFIG_FILE = 'spike_config.json'
+# Kept next to the script so the controller and the daemon share one file
+# whatever directory each was started from.
+CONFIG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'spike_config.json')
+_config_cache = {'stamp': None, 'data': None}
+
+# --- Serial Receive Buffer ---
+RECV_BUF_SIZE = 4096
+RECV_BUF_SLACK = 512  # Compact once fewer than this many bytes remain free
+READ_CHUNK_MAX = RECV_BUF_SIZE - RECV_BUF_SLACK  # Largest single read, so a chunk always fits
+READ_NOTIFY_BYTES = 256  # Wake the parser at least this often even without a complete frame
+READ_QUEUE_CHUNKS = 1024  # Raw reads held for the parser before the oldest are dropped
+READ_WAIT = 0.5  # Seconds the parser waits for data before rechecking for stop
+
+# --- Serial Connection ---
+STABILIZE_TIMEOUT = 1.0  # Longest wait for the first frame after opening the port
+STABILIZE_POLL = 0.01  # Seconds between checks while waiting
+
+# --- Background Daemon ---
+# spike_daemon.py listens here and keeps the serial port open between runs.
+DAEMON_ADDRESS = ('127.0.0.1', 50763)
+DAEMON_CONNECT_TIMEOUT = 0.2  # Seconds; a local daemon accepts at once, so give up fast when none runs
+DAEMON_TIMEOUT = 5  # Seconds; opening the port in the daemon can take up to 1 s
+DAEMON_POLL_INTERVAL = 0.5  # Seconds between status checks while attached in quiet mode
+DAEMON_SESSION_LEASE = 5  # Seconds without a status check before the daemon stops clicking
+
+# --- Live Display ---
+DISPLAY_REFRESH_INTERVAL = 0.05  # Seconds between sensor panel redraws (~20 Hz)
+
+# --- Click Detection ---
+# Indexed by (was_pressed << 1) | is_pressed; only released -> pressed clicks.
+# A table lookup replaces the if/elif cascade on the unpredictable press state.
+RISING_EDGE = (0, 1, 0, 0)
+
+# --- Sensor Message Parsing ---
+# Fast path for the fixed frame shape {"m":0,"p":[[63,[force_value,is_touched]], ...]}
+# where 63 is the force sensor on port F.
+FORCE_MESSAGE_PREFIX = b'{"m":0,'
+_FAST = re.compile(rb'\[63,\s*\[(-?\d+(?:\.\d+)?)\s*,\s*([01])\]\]').search
 
 # --- Rich Console Initialization ---
 console = Console()
 
+def _make_native_click():
+    """
+    Returns a function that sends a left mouse click at the current cursor
+    position using the operating system's input API, falling back to
+    pyautogui when no native backend is available.
+    """
+    try:
+        if sys.platform == 'win32':
+            import ctypes
+            mouse_event = ctypes.windll.user32.mouse_event
+            MOUSEEVENTF_LEFTDOWN, MOUSEEVENTF_LEFTUP = 0x0002, 0x0004
+
+            def click():
+                mouse_event(MOUSEEVENTF_LEFTDOWN, 0, 0, 0, 0)
+                mouse_event(MOUSEEVENTF_LEFTUP, 0, 0, 0, 0)
+            return click
+
+        if sys.platform == 'darwin':
+            import Quartz
+
+            def click():
+                pos = Quartz.CGEventGetLocation(Quartz.CGEventCreate(None))
+                for event_type in (Quartz.kCGEventLeftMouseDown, Quartz.kCGEventLeftMouseUp):
+                    event = Quartz.CGEventCreateMouseEvent(None, event_type, pos, Quartz.kCGMouseButtonLeft)
+                    Quartz.CGEventPost(Quartz.kCGHIDEventTap, event)
+            return click
+
+        from Xlib import X, display
+        from Xlib.ext import xtest
+        x_display = display.Display()
+
+        def click():
+            xtest.fake_input(x_display, X.ButtonPress, 1)
+            xtest.fake_input(x_display, X.ButtonRelease, 1)
+            x_display.sync()
+        return click
+    except Exception:
+        # pyautogui is heavy to import, so only load it when it is really needed
+        import pyautogui
+        # pyautogui's corner failsafe would otherwise raise mid-session
+        pyautogui.FAILSAFE = False
+        return pyautogui.click
+
 def load_config():
-    """Loads configuration from a JSON file."""
-    if os.path.exists(CONFIG_FILE):
-        with open(CONFIG_FILE, 'r') as f:
-            return json.load(f)
-    return {}
+    """
+    Loads configuration from a JSON file. The parsed result is cached and only
+    re-read when the file changes on disk.
+    """
+    try:
+        st = os.stat(CONFIG_FILE)
+    except FileNotFoundError:
+        return {}
+    stamp = (st.st_mtime_ns, st.st_size)
+    if stamp == _config_cache['stamp']:
+        return _config_cache['data']
+    with open(CONFIG_FILE, 'rb') as f:
+        data = json_loads(f.read())
+    _config_cache.update(stamp=stamp, data=data)
+    return data
 
 def save_config(serial_number, threshold):
     """Saves configuration to a JSON file."""
@@ -34,13 +136,66 @@ def save_config(serial_number, threshold):
         json.dump(config, f, indent=4)
     console.print(f"[green]Configuration saved to {CONFIG_FILE}[/green]")
 
-def select_device():
+def parse_force_message(line):
+    """
+    Extracts (force_value, is_touched) from a raw Spike message, or returns
+    None if the message is malformed or carries no force sensor reading.
+    The message may be bytes or a memoryview into the receive buffer.
+    """
+    if line[:len(FORCE_MESSAGE_PREFIX)] == FORCE_MESSAGE_PREFIX:
+        m = _FAST(line)
+        if m:
+            return float(m.group(1)), m.group(2) == b'1'
+
+    # Slow path: anything the regex does not recognise goes through the full decoder.
+    # Decoding is the only step that can fail; the structure is checked explicitly
+    # so odd frames are skipped without raising.
+    try:
+        message = json_loads(line)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+    # Expected format from Spike: {"force": N} or similar.
+    # This part must be adapted to the EXACT JSON your Spike sends.
+    # For this example, we assume the original logic's data structure.
+    # {"m": 0, "p": [[63, [force_value, is_touched]]]}
+    if not isinstance(message, dict) or message.get('m') != 0:
+        return None
+    ports = message.get('p')
+    if not isinstance(ports, list):
+        return None
+    for item in ports:
+        if isinstance(item, list) and len(item) == 2 and item[0] == 63: # Port F, Force Sensor
+            values = item[1]
+            if (isinstance(values, list) and len(values) >= 2
+                    and isinstance(values[0], (int, float)) and not isinstance(values[0], bool)):
+                force_value = values[0] # Force in Newtons (0-10)
+                is_touched = values[1] == 1 # Boolean for touched state
+                return force_value, is_touched
+    return None
+
+def daemon_request(request):
+    """
+    Sends a request to a running spike_daemon and returns its reply, or None
+    if no daemon is running.
+    """
+    try:
+        with socket.create_connection(DAEMON_ADDRESS, timeout=DAEMON_CONNECT_TIMEOUT) as sock:
+            sock.settimeout(DAEMON_TIMEOUT)
+            sock.sendall(json.dumps(request).encode('utf-8') + b'\n')
+            reply = sock.makefile('rb').readline()
+    except OSError:
+        return None
+    return json.loads(reply) if reply else None
+
+def select_device(comports=None):
     """
     Scans for serial devices, displays them in a table, and prompts the user
-    to select one.
+    to select one. An already enumerated list of ports can be passed in to
+    skip the scan.
     """
-    console.print("[bold cyan]Scanning for connected serial devices...[/bold cyan]")
-    comports = list(serial.tools.list_ports.comports())
+    if comports is None:
+        console.print("[bold cyan]Scanning for connected serial devices...[/bold cyan]")
+        comports = list(serial.tools.list_ports.comports())
 
     if not comports:
         console.print("[bold red]No serial devices found. Please ensure your Spike Prime is connected.[/bold red]")
@@ -77,29 +232,39 @@ def main():
     """
     Main function to orchestrate device connection, configuration, and monitoring.
     """
+    parser = argparse.ArgumentParser(description="LEGO Spike Prime Mouse Controller")
+    parser.add_argument('--quiet', action='store_true', help="Hide the live sensor display (for headless use)")
+    args = parser.parse_args()
+
     console.rule("[bold blue]LEGO Spike Prime Mouse Controller[/bold blue]")
-    config = load_config()
+    # A running daemon already has the config loaded and may hold the port open.
+    daemon = daemon_request({'cmd': 'ping'})
+    config = daemon['config'] if daemon else load_config()
     spike_port = None
     serial_number = None
 
     # --- Device Selection Logic ---
     if 'serial_number' in config and config['serial_number']:
-        if Confirm.ask(f"Found saved serial number [yellow]{config['serial_number']}[/yellow]. Use this device?"):
-            # Verify the device is still available
-            comports = serial.tools.list_ports.comports()
-            found = False
-            for port in comports:
-                if port.serial_number == config['serial_number']:
-                    spike_port = port.device
-                    serial_number = port.serial_number
-                    console.print(f"[green]Found saved Spike Prime at: {spike_port}[/green]")
-                    found = True
-                    break
-            if not found:
-                console.print("[bold red]Saved device not found. Please select a new one.[/bold red]")
-                spike_port, serial_number = select_device()
-        else:
+        if not Confirm.ask(f"Found saved serial number [yellow]{config['serial_number']}[/yellow]. Use this device?"):
             spike_port, serial_number = select_device()
+        elif daemon and daemon['connected'] and daemon['serial_number'] == config['serial_number']:
+            # The daemon still has the device open, so there is no need to rescan.
+            spike_port = daemon['port']
+            serial_number = daemon['serial_number']
+            console.print(f"[green]Spike Prime already open in the daemon at: {spike_port}[/green]")
+        else:
+            # Verify the device is still available. The port list is only
+            # enumerated once and reused if the user has to pick another device.
+            comports = list(serial.tools.list_ports.comports())
+            by_serial_number = {port.serial_number: port for port in comports if port.serial_number}
+            port = by_serial_number.get(config['serial_number'])
+            if port:
+                spike_port = port.device
+                serial_number = port.serial_number
+                console.print(f"[green]Found saved Spike Prime at: {spike_port}[/green]")
+            else:
+                console.print("[bold red]Saved device not found. Please select a new one.[/bold red]")
+                spike_port, serial_number = select_device(comports)
     else:
         spike_port, serial_number = select_device()
 
@@ -121,83 +286,315 @@ def main():
     save_config(serial_number, trigger_threshold)
 
     # --- Sensor Monitoring ---
-    monitor_device(spike_port, trigger_threshold)
+    if daemon:
+        reply = daemon_request({
+            'cmd': 'monitor',
+            'port': spike_port,
+            'serial_number': serial_number,
+            'threshold': trigger_threshold
+        })
+        if reply and reply.get('ok'):
+            follow_daemon(quiet=args.quiet)
+            return
+        console.print("[bold red]The daemon could not open the device; monitoring here instead.[/bold red]")
+
+    monitor_device(spike_port, trigger_threshold, quiet=args.quiet)
 
 
-def monitor_device(port, threshold):
+def scan_frames(mv, start, end, parse):
     """
-    Connects to the Spike Prime, monitors the force sensor, and triggers mouse clicks.
+    Parses every b'\\r'-terminated frame in mv[start:end] and returns the
+    readings. Malformed frames parse to None and are skipped.
+    """
+    find = mv.obj.find
+    readings = []
+    while start < end:
+        i = find(b'\r', start, end)
+        if i < 0:
+            break
+        if i > start:
+            reading = parse(mv[start:i])
+            if reading is not None:
+                readings.append(reading)
+        start = i + 1
+    return readings
+
+try:
+    # Optional compiled scan_frames; build it with `cythonize -i spike_fast.pyx`
+    from spike_fast import scan_frames
+except ImportError:
+    pass
+
+
+def _read_serial(ser, chunks, ready, halt, stop, errors):
+    """
+    Reader thread: drains the serial port into the chunks queue until halted,
+    so slow parsing or rendering never holds up USB reads.
+    """
+    read = ser.read
+    append = chunks.append
+    # Bytes queued since the consumer was last woken. Chunks are published in
+    # batches: the consumer is only signalled once a frame terminator arrives or
+    # enough data has piled up, since it cannot parse anything before then.
+    unsignalled = 0
+    try:
+        while not halt.is_set() and (stop is None or not stop.is_set()):
+            # Drain everything the OS has buffered in one call, or block
+            # for at least one byte when nothing is waiting yet.
+            n = min(ser.in_waiting, READ_CHUNK_MAX)
+            data = read(n) if n else read(1)
+            if data:
+                append(data)
+                unsignalled += len(data)
+                if unsignalled >= READ_NOTIFY_BYTES or b'\r' in data:
+                    unsignalled = 0
+                    # is_set() is a plain flag read; set() takes the event's lock
+                    if not ready.is_set():
+                        ready.set()
+    except Exception as e:
+        # Includes plain OSError (e.g. EIO from in_waiting when the hub is
+        # unplugged on Linux); the consumer re-raises it
+        errors.append(e)
+    finally:
+        halt.set()
+        ready.set()
+
+
+def read_force_batches(ser, stop=None):
+    """
+    Reads from the serial port and yields, for each wakeup, the list of
+    (force_value, is_touched) readings from every complete frame received.
+    Stops once the optional stop event is set.
     """
+    # A single producer thread appends raw chunks and a single consumer (this
+    # generator) pops them; deque.append/popleft are atomic under the GIL.
+    chunks = deque(maxlen=READ_QUEUE_CHUNKS)
+    ready = threading.Event()
+    halt = threading.Event()
+    errors = []
+    reader = threading.Thread(target=_read_serial, args=(ser, chunks, ready, halt, stop, errors), daemon=True)
+    reader.start()
+
+    # Receive buffer: bytes live in buf[head:tail]; scan marks how far we
+    # have already searched for a frame terminator. Frames are handed to the
+    # parser as memoryview slices, so the buffer must never be resized.
+    buf = bytearray(RECV_BUF_SIZE)
+    mv = memoryview(buf)
+    head = tail = scan = 0
+    rfind = buf.rfind
+    popleft = chunks.popleft
+    scan_batch = scan_frames
+    parse = parse_force_message
+    # A chunk taken off the queue that did not fit yet. It is held here rather
+    # than left in the deque, where the reader could evict it once full.
+    pending = None
+
+    try:
+        while stop is None or not stop.is_set():
+            if pending is None and not chunks:
+                # Wait with a timeout so CTRL+C is still handled promptly on Windows
+                ready.wait(READ_WAIT)
+                ready.clear()
+                if not chunks:
+                    # The reader only stops on error or stop request
+                    if errors:
+                        raise errors[0]
+                    if halt.is_set():
+                        if stop is not None and stop.is_set():
+                            return
+                        raise serial.SerialException("Serial reader stopped unexpectedly")
+                    continue
+
+            # Move queued chunks into the buffer until it runs out of room;
+            # anything left over is picked up on the next pass.
+            while pending is not None or chunks:
+                if pending is not None:
+                    data, pending = pending, None
+                else:
+                    data = popleft()
+                n = len(data)
+
+                # Compact the buffer before it fills up, moving the
+                # unparsed tail back to the start.
+                if tail + n > RECV_BUF_SIZE - RECV_BUF_SLACK:
+                    buf[:tail - head] = buf[head:tail]
+                    tail -= head
+                    scan -= head
+                    head = 0
+                    if tail + n > RECV_BUF_SIZE:
+                        if scan < tail:
+                            # Frame what is already buffered first
+                            pending = data
+                            break
+                        # No terminator in a whole buffer's worth of data; drop it.
+                        head = tail = scan = 0
+                buf[tail:tail + n] = data
+                tail += n
+
+            # Only the last terminator matters: everything before it is a run of
+            # complete frames that can be parsed in one pass.
+            cut = rfind(b'\r', scan, tail)
+            if cut < 0:
+                scan = tail
+                continue
+
+            batch = scan_batch(mv, head, cut + 1, parse)
+            head = scan = cut + 1
+
+            if batch:
+                yield batch
+    finally:
+        halt.set()
+        # Make sure the reader has left ser.read() before the port is reused,
+        # otherwise whatever it reads next is lost to the next session.
+        if reader.is_alive():
+            try:
+                ser.cancel_read()
+            except (serial.SerialException, OSError, AttributeError):
+                pass
+            reader.join()
+
+
+def _loop_instant(batches, threshold, click, render):
+    """Instant press mode: clicks as soon as the sensor reports a touch."""
+    is_pressed = False
+    last_render = 0.0
+    rising = RISING_EDGE
+    log = console.log
+    monotonic = time.monotonic
+
+    for batch in batches:
+        # A press cannot bounce within a single read, so emit at most one
+        # click per batch on a rising edge.
+        edges = 0
+        for force_value, is_touched in batch:
+            edges |= rising[(is_pressed << 1) | is_touched]
+            is_pressed = is_touched
+
+        if edges:
+            click()
+            log("Click! (Instant Press)")
+
+        # Update live display, rate-limited so rendering never
+        # holds up click detection
+        if render is not None:
+            now = monotonic()
+            if now - last_render > DISPLAY_REFRESH_INTERVAL:
+                render(force_value)
+                last_render = now
+
+
+def _loop_threshold(batches, threshold, click, render):
+    """Threshold mode: clicks once the force reaches the trigger threshold."""
+    is_pressed = False
+    last_render = 0.0
+    rising = RISING_EDGE
+    log = console.log
+    monotonic = time.monotonic
+
+    for batch in batches:
+        # A press cannot bounce within a single read, so emit at most one
+        # click per batch on a rising edge.
+        edges = 0
+        for force_value, is_touched in batch:
+            is_over = force_value >= threshold
+            edges |= rising[(is_pressed << 1) | is_over]
+            is_pressed = is_over
+
+        if edges:
+            click()
+            log(f"Click! (Threshold: {threshold}N)")
+
+        # Update live display, rate-limited so rendering never
+        # holds up click detection
+        if render is not None:
+            now = monotonic()
+            if now - last_render > DISPLAY_REFRESH_INTERVAL:
+                render(force_value)
+                last_render = now
+
+
+def open_serial(port):
+    """
+    Opens the Spike Prime serial port and waits for it to stabilize: startup
+    noise is discarded until a complete frame shows the stream is in sync,
+    waiting at most STABILIZE_TIMEOUT if nothing arrives.
+    """
+    ser = serial.Serial(port, 115200, timeout=1)
     try:
-        recv_buf = bytearray()
-        is_pressed = False
+        deadline = time.monotonic() + STABILIZE_TIMEOUT
+        while time.monotonic() < deadline:
+            chunk = ser.read(ser.in_waiting)
+            if b'\r' in chunk:
+                # Saw a frame boundary; drop the partial data and start clean
+                ser.reset_input_buffer()
+                break
+            time.sleep(STABILIZE_POLL)
+    except BaseException:
+        # The caller never receives the handle, so release it here
+        ser.close()
+        raise
+    return ser
+
 
+def run_monitor(ser, threshold, render=None, stop=None):
+    """
+    Watches the force sensor on an open serial port and clicks on each press
+    until the port fails or the optional stop event is set.
+    """
+    # Resolve the click backend before the first press so it adds no latency.
+    click = _make_native_click()
+
+    # The mode never changes during a session, so pick its loop once.
+    loop = _loop_instant if threshold == 1 else _loop_threshold
+    loop(read_force_batches(ser, stop), threshold, click, render)
+
+
+def _make_live_display(quiet):
+    """
+    Returns (live, render): a context manager for the sensor panel and a
+    function that shows a force value in it. With quiet=True there is no
+    display and render is None.
+    """
+    if quiet:
+        return contextlib.nullcontext(), None
+
+    from rich.live import Live
+    from rich.panel import Panel
+    from rich.text import Text
+
+    # A single renderable is reused for every update; only its text changes.
+    status_text = Text("", justify="center", style="bold")
+    status_panel = Panel(status_text, title="Sensor Status", border_style="blue")
+    live = Live(status_panel, console=console, screen=False, auto_refresh=False, vertical_overflow="visible")
+
+    def render(force_value):
+        status_text.plain = f"Live Force: {force_value:.2f} N"
+        live.refresh()
+
+    return live, render
+
+
+def monitor_device(port, threshold, quiet=False):
+    """
+    Connects to the Spike Prime, monitors the force sensor, and triggers mouse clicks.
+    With quiet=True the live sensor display is skipped.
+    """
+    try:
         console.rule(f"[bold green]Connecting to {port}...[/bold green]")
-        with serial.Serial(port, 115200, timeout=1) as ser:
+        with open_serial(port) as ser:
             console.print("[bold green]Successfully connected![/bold green]")
             console.print("Press [bold]CTRL+C[/bold] to exit.")
-            time.sleep(1) # Give it a moment to stabilize
-
-            with Live(console=console, screen=False, auto_refresh=False, vertical_overflow="visible") as live:
-                while True:
-                    try:
-                        # Request sensor data by sending a message.
-                        # This assumes the Spike is running a program that sends sensor data upon receiving any byte.
-                        data = ser.read_until(b'\r')
-
-                        if not data:
-                            continue
-
-                        recv_buf.extend(data)
-
-                        if b'\r' in recv_buf:
-                            lines = recv_buf.split(b'\r')
-                            for line in lines[:-1]:
-                                if not line:
-                                    continue
-                                try:
-                                    message = json.loads(line.decode('utf-8'))
-                                    # Expected format from Spike: {"force": N} or similar.
-                                    # This part must be adapted to the EXACT JSON your Spike sends.
-                                    # For this example, we assume the original logic's data structure.
-                                    # {"m": 0, "p": [[63, [force_value, is_touched]]]}
-                                    if message['m'] == 0:
-                                        for item in message['p']:
-                                            if isinstance(item, list) and item[0] == 63: # Port F, Force Sensor
-                                                force_value = item[1][0] # Force in Newtons (0-10)
-                                                is_touched = item[1][1] == 1 # Boolean for touched state
-
-                                                # Update live display
-                                                panel_content = Text(f"Live Force: {force_value:.2f} N", justify="center", style="bold")
-                                                live.update(Panel(panel_content, title="Sensor Status", border_style="blue"), refresh=True)
-
-                                                # Click logic
-                                                if threshold == 1: # Instant press mode
-                                                    if is_touched and not is_pressed:
-                                                        is_pressed = True
-                                                        pyautogui.click()
-                                                        console.log("Click! (Instant Press)")
-                                                    elif not is_touched and is_pressed:
-                                                        is_pressed = False
-                                                else: # Threshold mode
-                                                    if force_value >= threshold and not is_pressed:
-                                                        is_pressed = True
-                                                        pyautogui.click()
-                                                        console.log(f"Click! (Threshold: {threshold}N)")
-                                                    elif force_value < threshold and is_pressed:
-                                                        is_pressed = False
-                                except (json.JSONDecodeError, KeyError, IndexError):
-                                    # Ignore malformed data, but log it for debugging
-                                    # console.log(f"[dim]Could not parse: {line}[/dim]")
-                                    pass
-                            recv_buf = recv_buf[recv_buf.rfind(b'\r')+1:]
-
-                    except serial.SerialException:
-                        console.print("[bold red]Error: Serial device disconnected.[/bold red]")
-                        break
-                    except KeyboardInterrupt:
-                        console.print("\n[bold yellow]Exiting program.[/bold yellow]")
-                        return
+
+            live, render = _make_live_display(quiet)
+            with live:
+                try:
+                    run_monitor(ser, threshold, render)
+                except (serial.SerialException, OSError):
+                    console.print("[bold red]Error: Serial device disconnected.[/bold red]")
+                except KeyboardInterrupt:
+                    console.print("\n[bold yellow]Exiting program.[/bold yellow]")
+                    return
 
     except serial.SerialException as e:
         console.print(f"[bold red]Error: Could not open serial port '{port}'.[/bold red]")
@@ -206,5 +603,31 @@ def monitor_device(port, threshold):
         console.print(f"[bold red]An unexpected error occurred: {e}[/bold red]")
 
 
+def follow_daemon(quiet=False):
+    """
+    Stays attached to the daemon's monitoring session, showing the live force
+    until CTRL+C, then tells the daemon to stop clicking. The serial port stays
+    open in the daemon for the next run.
+    """
+    console.print("[bold green]Monitoring handed off to the daemon.[/bold green]")
+    console.print("Press [bold]CTRL+C[/bold] to exit.")
+
+    live, render = _make_live_display(quiet)
+    interval = DAEMON_POLL_INTERVAL if quiet else DISPLAY_REFRESH_INTERVAL
+    try:
+        with live:
+            while True:
+                time.sleep(interval)
+                status = daemon_request({'cmd': 'ping'})
+                if not status or not status.get('monitoring'):
+                    console.print("[bold red]Error: The daemon stopped monitoring.[/bold red]")
+                    return
+                if render is not None and status.get('force') is not None:
+                    render(status['force'])
+    except KeyboardInterrupt:
+        daemon_request({'cmd': 'stop'})
+        console.print("\n[bold yellow]Exiting program.[/bold yellow]")
+
+
 if __name__ == "__main__":
     main()
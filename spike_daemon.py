@@ -0,0 +1,187 @@
+import json
+import socketserver
+import threading
+import time
+
+import serial
+
+from spike_controller import (
+    DAEMON_ADDRESS,
+    DAEMON_POLL_INTERVAL,
+    DAEMON_SESSION_LEASE,
+    console,
+    load_config,
+    open_serial,
+    run_monitor
+)
+
+
+class SpikeDaemon:
+    """
+    Keeps the Spike Prime serial port open between controller runs and runs
+    one monitoring session on it at a time.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.ser = None
+        self.serial_number = None
+        self.session = None  # (thread, stop event) of the running monitor
+        self.force = None  # Latest force reading, for attached controllers
+        # Sessions are leased to the attached controller, which renews the
+        # lease with every status check; see _watch_lease
+        self.last_ping = 0.0
+
+    def status(self):
+        """Reports the saved configuration and whether the device is still open."""
+        with self.lock:
+            self.last_ping = time.monotonic()
+            connected = self.ser is not None and self.ser.is_open
+            monitoring = self.session is not None and self.session[0].is_alive()
+            return {
+                'ok': True,
+                'config': load_config(),
+                'connected': connected,
+                'port': self.ser.port if connected else None,
+                'serial_number': self.serial_number if connected else None,
+                'monitoring': monitoring,
+                'force': self.force if monitoring else None
+            }
+
+    def monitor(self, port, serial_number, threshold):
+        """Starts monitoring, reusing the open port if it is the same device."""
+        with self.lock:
+            self._stop_session()
+            if self.ser is None or not self.ser.is_open or self.ser.port != port:
+                self._close()
+                try:
+                    self.ser = open_serial(port)
+                except serial.SerialException as e:
+                    console.print(f"[bold red]Error: Could not open serial port '{port}'.[/bold red]")
+                    return {'ok': False, 'error': str(e)}
+                console.print(f"[bold green]Connected to {port}.[/bold green]")
+            else:
+                # Frames queued while no session was running are stale; a
+                # leftover touched frame would otherwise register as a new press
+                self.ser.reset_input_buffer()
+            self.serial_number = serial_number
+            self.force = None
+
+            stop = threading.Event()
+            thread = threading.Thread(target=self._run, args=(self.ser, threshold, stop), daemon=True)
+            self.session = (thread, stop)
+            self.last_ping = time.monotonic()
+            thread.start()
+            threading.Thread(target=self._watch_lease, args=(self.ser, stop), daemon=True).start()
+        console.print(f"Monitoring with trigger threshold [cyan]{threshold}[/cyan].")
+        return {'ok': True}
+
+    def stop(self):
+        """Stops clicking but keeps the serial port open for the next session."""
+        with self.lock:
+            self._stop_session()
+        console.print("Monitoring stopped.")
+        return {'ok': True}
+
+    def close(self):
+        """Stops monitoring and releases the serial port."""
+        with self.lock:
+            self._stop_session()
+            self._close()
+
+    def _run(self, ser, threshold, stop):
+        try:
+            run_monitor(ser, threshold, render=self._record_force, stop=stop)
+        except (serial.SerialException, OSError):
+            console.print("[bold red]Error: Serial device disconnected.[/bold red]")
+            # Closing marks the device as gone so the next run rescans for it
+            ser.close()
+
+    def _watch_lease(self, ser, stop):
+        # Stop clicking once the controller stops checking in, e.g. because its
+        # terminal was closed or it was killed without sending 'stop'
+        while not stop.wait(DAEMON_POLL_INTERVAL):
+            if time.monotonic() - self.last_ping > DAEMON_SESSION_LEASE:
+                console.print("[bold yellow]Controller went away; monitoring stopped.[/bold yellow]")
+                stop.set()
+                # Wake the reader if it is blocked waiting for data
+                if ser.is_open:
+                    ser.cancel_read()
+                return
+
+    def _record_force(self, force_value):
+        self.force = force_value
+
+    def _stop_session(self):
+        if self.session is None:
+            return
+        thread, stop = self.session
+        self.session = None
+        stop.set()
+        # Wake the reader if it is blocked waiting for data
+        if self.ser.is_open:
+            self.ser.cancel_read()
+        thread.join()
+
+    def _close(self):
+        if self.ser is not None:
+            self.ser.close()
+        self.ser = None
+        self.serial_number = None
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Answers one JSON request per connection with one JSON reply."""
+
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline())
+        except ValueError:
+            return
+        if not isinstance(request, dict):
+            return
+
+        spike = self.server.spike
+        cmd = request.get('cmd')
+        if cmd == 'ping':
+            reply = spike.status()
+        elif cmd == 'stop':
+            reply = spike.stop()
+        elif cmd == 'monitor':
+            port = request.get('port')
+            serial_number = request.get('serial_number')
+            threshold = request.get('threshold')
+            if not isinstance(port, str) or not isinstance(serial_number, str):
+                reply = {'ok': False, 'error': "monitor needs 'port' and 'serial_number' strings"}
+            elif not isinstance(threshold, (int, float)) or isinstance(threshold, bool):
+                reply = {'ok': False, 'error': "monitor needs a numeric 'threshold'"}
+            else:
+                reply = spike.monitor(port, serial_number, threshold)
+        else:
+            reply = {'ok': False, 'error': f"Unknown command: {cmd}"}
+        self.wfile.write(json.dumps(reply).encode('utf-8') + b'\n')
+
+
+def main():
+    """
+    Runs the daemon until interrupted. spike_controller.py hands monitoring
+    over to it automatically while it is running.
+    """
+    console.rule("[bold blue]LEGO Spike Prime Daemon[/bold blue]")
+    spike = SpikeDaemon()
+
+    socketserver.TCPServer.allow_reuse_address = True
+    with socketserver.TCPServer(DAEMON_ADDRESS, _RequestHandler) as server:
+        server.spike = spike
+        host, port = DAEMON_ADDRESS
+        console.print(f"Listening on [cyan]{host}:{port}[/cyan]. Press [bold]CTRL+C[/bold] to exit.")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            console.print("\n[bold yellow]Exiting daemon.[/bold yellow]")
+        finally:
+            spike.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled frame scanner for spike_controller.py. Build it in place with
+
+    cythonize -i spike_fast.pyx
+
+spike_controller.py falls back to its pure Python scan_frames when this
+extension has not been built.
+"""
+from libc.string cimport memchr
+
+
+def scan_frames(object mv, Py_ssize_t start, Py_ssize_t end, object parse):
+    """
+    Parses every b'\\r'-terminated frame in mv[start:end] and returns the
+    readings. Malformed frames parse to None and are skipped.
+    """
+    cdef const unsigned char[::1] view = mv
+    cdef const unsigned char *base = &view[0]
+    cdef const unsigned char *p
+    cdef Py_ssize_t i
+    cdef list readings = []
+
+    while start < end:
+        p = <const unsigned char *>memchr(base + start, b'\r', end - start)
+        if p == NULL:
+            break
+        i = p - base
+        if i > start:
+            reading = parse(mv[start:i])
+            if reading is not None:
+                readings.append(reading)
+        start = i + 1
+    return readings